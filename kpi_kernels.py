@@ -0,0 +1,199 @@
+"""
+Numeric kernels for the Product Management KPI API
+Hot time-series math compiled with Numba when available (NumPy fallback otherwise)
+
+Only math that loops or has branches lives here. The single-division scalar
+calculators (ARPU, CAC, conversion rate, ...) stay in plain Python on purpose:
+crossing the Python/Numba boundary costs more than the division it would save.
+"""
+
+import numpy as np
+
+# Try to import Numba for JIT compilation
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator so kernels still run as plain Python without numba"""
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def trend_slope(y):
+    """Least-squares slope of y over x = 0..n-1"""
+    n = y.shape[0]
+    x_mean = (n - 1) * 0.5
+    y_mean = 0.0
+    for i in range(n):
+        y_mean += y[i]
+    y_mean /= n
+
+    num = 0.0
+    den = 0.0
+    for i in range(n):
+        dx = i - x_mean
+        num += dx * (y[i] - y_mean)
+        den += dx * dx
+    if den == 0.0:
+        return 0.0
+    return num / den
+
+
+@njit(cache=True, fastmath=True)
+def volatility(y):
+    """Coefficient of variation (std / mean); 0 when the mean is 0"""
+    n = y.shape[0]
+    mean = 0.0
+    for i in range(n):
+        mean += y[i]
+    mean /= n
+    if mean == 0.0:
+        return 0.0
+
+    var = 0.0
+    for i in range(n):
+        d = y[i] - mean
+        var += d * d
+    var /= n
+    return np.sqrt(var) / mean
+
+
+@njit(cache=True, fastmath=True)
+def retention_kernel(start, end, new):
+    """Retention rate in percent, clamped to [0, 100]"""
+    rate = (end - new) / start * 100.0
+    if rate < 0.0:
+        return 0.0
+    if rate > 100.0:
+        return 100.0
+    return rate
+
+
+@njit(cache=True, fastmath=True)
+def nrr_kernel(begin, expansion, contraction, churned, upsell):
+    """NRR in percent via reciprocal-multiply (division blocks vectorization)"""
+    return (begin + expansion + upsell - contraction - churned) * (1.0 / begin) * 100.0
+
+
+@njit(cache=True, fastmath=True)
+def fused_stats(y, recent_k):
+    """Mean, std, least-squares slope and mean of the last `recent_k` values,
+    all accumulated in a single pass so the array is read once instead of four times"""
+    n = y.shape[0]
+    s = 0.0
+    sq = 0.0
+    sxy = 0.0
+    recent = 0.0
+    start = n - recent_k
+    for i in range(n):
+        v = y[i]
+        s += v
+        sq += v * v
+        sxy += i * v
+        if i >= start:
+            recent += v
+
+    mean = s / n
+    var = sq / n - mean * mean
+    if var < 0.0:
+        var = 0.0  # guard against fastmath rounding
+    std = np.sqrt(var)
+
+    # sum((i - x_mean)^2) for x = 0..n-1 has the closed form n(n^2-1)/12
+    x_mean = (n - 1) * 0.5
+    den = n * (n * n - 1) / 12.0
+    slope = (sxy - n * x_mean * mean) / den if den != 0.0 else 0.0
+
+    k = recent_k if recent_k < n else n
+    return mean, std, slope, recent / k
+
+
+@njit(cache=True, fastmath=True)
+def linear_forecast(y, periods):
+    """Extrapolate the least-squares trend `periods` steps past the last value (clamped at 0)"""
+    slope = trend_slope(y)
+    last = y[y.shape[0] - 1]
+    out = np.empty(periods, dtype=np.float64)
+    for i in range(periods):
+        pred = last + slope * (i + 1)
+        out[i] = pred if pred > 0.0 else 0.0
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def gb_forecast(window, periods, features, thresholds, lefts, rights, leaf_values, init, lr):
+    """Recursive multi-step gradient-boosting forecast over stacked tree arrays.
+
+    Each tree is descended with plain array indexing (features/thresholds/
+    children padded to the widest tree; lefts == -1 marks a leaf), so the whole
+    forecast runs without any sklearn predict calls. Emitted predictions are
+    clamped at 0, while the rolling window keeps the raw model output to match
+    the reference recursive forecast.
+    """
+    out = np.empty(periods, dtype=np.float64)
+    w = window.copy()
+    n_trees = features.shape[0]
+    for p in range(periods):
+        acc = init
+        for t in range(n_trees):
+            node = 0
+            while lefts[t, node] != -1:
+                if w[features[t, node]] <= thresholds[t, node]:
+                    node = lefts[t, node]
+                else:
+                    node = rights[t, node]
+            acc += lr * leaf_values[t, node]
+        out[p] = acc if acc > 0.0 else 0.0
+        for i in range(w.shape[0] - 1):
+            w[i] = w[i + 1]
+        w[w.shape[0] - 1] = acc
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def financial_bundle(begin, expansion, upsell, churn, contraction,
+                     new_ref_rev, new_tot_rev, cac, avg_life, arpu):
+    """NRR, ENC, EGR, CLTV and CLTV:CAC for whole cohort columns in one pass.
+
+    The five outputs share subexpressions and input columns, so fusing them
+    touches each cache line once instead of once per metric; zero denominators
+    yield 0 for the affected output.
+    """
+    n = begin.shape[0]
+    nrr = np.empty(n, dtype=np.float64)
+    enc = np.empty(n, dtype=np.float64)
+    egr = np.empty(n, dtype=np.float64)
+    cltv = np.empty(n, dtype=np.float64)
+    ratio = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        inv_begin = 1.0 / begin[i] if begin[i] != 0.0 else 0.0
+        end_mrr = begin[i] + expansion[i] + upsell[i] - churn[i] - contraction[i]
+        nrr[i] = end_mrr * inv_begin * 100.0
+        enc[i] = new_ref_rev[i] / new_tot_rev[i] * 100.0 if new_tot_rev[i] != 0.0 else 0.0
+        egr[i] = nrr[i] + enc[i] - 100.0
+        cltv[i] = avg_life[i] * arpu[i]
+        ratio[i] = cltv[i] / cac[i] if cac[i] != 0.0 else 0.0
+    return nrr, enc, egr, cltv, ratio
+
+
+def warm_kernels():
+    """Trigger JIT compilation once so the first real request doesn't pay it"""
+    dummy = np.array([1.0, 2.0, 3.0])
+    retention_kernel(100.0, 95.0, 10.0)
+    nrr_kernel(100.0, 10.0, 5.0, 5.0, 0.0)
+    trend_slope(dummy)
+    volatility(dummy)
+    fused_stats(dummy, 3)
+    linear_forecast(dummy, 2)
+    financial_bundle(dummy, dummy, dummy, dummy, dummy, dummy, dummy, dummy, dummy, dummy)
+    # Single-leaf dummy forest to compile the tree forecaster
+    leaf = -np.ones((1, 1), dtype=np.int64)
+    gb_forecast(dummy, 2, np.zeros((1, 1), dtype=np.int64), np.zeros((1, 1)),
+                leaf, leaf.copy(), np.zeros((1, 1)), 0.0, 0.1)